@@ -1 +1 @@
-from .migrations import run_migrations
+from .migrations import run_migrations, run_multi_tenant_migrations
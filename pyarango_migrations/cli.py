@@ -7,7 +7,13 @@ import sys
 import click
 
 from pyarango_migrations.constants import DEFAULTS
-from pyarango_migrations.migrations import create_migration_script, run_migrations
+from pyarango_migrations.migrations import (
+    compile_migration_scripts,
+    create_migration_script,
+    run_migrations,
+    run_multi_tenant_migrations,
+)
+from pyarango_migrations.utils import read_json
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -37,12 +43,30 @@ def create_cmd(name: str, **kwargs) -> None:
     create_migration_script(name, kwargs["directory"])
 
 
+@cli.command(name="compile")
+@click.option(
+    "--directory",
+    "-d",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    required=False,
+    default=DEFAULTS.script_directory,
+    show_default=True,
+    help="Directory containing the migration scripts.",
+)
+def compile_cmd(**kwargs) -> None:
+    """
+    Compile the migration scripts in the specified directory to bytecode, so later runs load them from __pycache__.
+    Useful as a deploy step when the scripts directory is read-only at runtime.
+    """
+    if not compile_migration_scripts(kwargs["directory"]):
+        sys.exit(1)
+
+
 class StdRunCommand(click.Command):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.params += [
             click.Option(("--host", "-h"), type=str, help="Host address.", default=DEFAULTS.host, show_default=True),
-            click.Option(("--dbname", "-d"), type=str, required=True, help="Database name."),
             click.Option(
                 ("--collection", "-c"),
                 type=str,
@@ -67,10 +91,18 @@ class StdRunCommand(click.Command):
             click.Option(
                 ("--target", "-t"), type=str, required=False, default=None, help="Target migration version. e.g. 0001"
             ),
+            click.Option(
+                ("--cache-history",),
+                is_flag=True,
+                default=False,
+                help="Cache applied migrations locally between runs. Only use when the migration history collection is "
+                "changed by this tool alone.",
+            ),
         ]
 
 
 @cli.command(name="run", cls=StdRunCommand)
+@click.option("--dbname", "-d", type=str, required=True, help="Database name.")
 def run_cmd(**kwargs) -> None:
     """
     Run database migrations for single-tenant database. If a target is specified, only migrations up to and including
@@ -94,21 +126,53 @@ def run_cmd(**kwargs) -> None:
     help="Path to JSON file containing database tenants.",
     required=True,
 )
+@click.option(
+    "--batch-size",
+    "-b",
+    type=click.IntRange(min=1),
+    default=DEFAULTS.batch_size,
+    show_default=True,
+    help="Number of tenants migrated per batch.",
+)
+@click.option(
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=DEFAULTS.workers,
+    show_default=True,
+    help="Number of tenants migrated concurrently.",
+)
+@click.option(
+    "--no-precompile",
+    is_flag=True,
+    default=False,
+    help="Do not compile migration scripts to bytecode before running migrations.",
+)
 def run_multi_tenant_cmd(**kwargs) -> None:
     """
-    Run database migrations for all tenants specified in tenants JSON file.
+    Run database migrations for all tenants specified in tenants JSON file. Tenants are migrated concurrently in
+    batches, and each batch must finish before the next one starts.
     """
     try:
-        tenants = json.load(open(kwargs["tenants_file"], "r"))
+        tenants = read_json(kwargs.pop("tenants_file"))
     except json.JSONDecodeError as e:
         logger.error(f"Invalid tenants file. {e}")
         sys.exit(1)
 
-    target = kwargs.pop("target")
+    try:
+        dbnames = [tenant["databaseName"] for tenant in tenants]
+    except (KeyError, TypeError):
+        logger.error("Invalid tenants file. Expected a list of objects with a databaseName.")
+        sys.exit(1)
 
-    for tenant in tenants:
-        dbname = tenant["databaseName"]
-        run_migrations(dbname=dbname, target=target, **kwargs)
+    try:
+        failures = run_multi_tenant_migrations(dbnames=dbnames, precompile=not kwargs.pop("no_precompile"), **kwargs)
+    except Exception:
+        logger.exception("multi-tenant: failed to start migrations")
+        sys.exit(1)
+
+    if failures:
+        sys.exit(1)
 
 
 def main():
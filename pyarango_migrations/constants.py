@@ -1,8 +1,7 @@
 import os
-from collections import namedtuple
-from typing import Final
+from typing import Final, NamedTuple
 
-BASE_DIR: Final = os.path.dirname(os.path.realpath(__file__))
+BASE_DIR: Final = os.path.dirname(os.path.abspath(__file__))
 
 # static files directory (for templates)
 TEMPLATES_DIR: Final = os.path.join(BASE_DIR, "templates")
@@ -11,25 +10,35 @@ MIGRATION_TEMPLATE_PATH: Final = os.path.join(TEMPLATES_DIR, "migration.txt")
 # database collection to store migration run information
 MIGRATION_COLLECTION: Final = "pyarango_migration_history"
 
-# directory to store migration files if not specified
-DEFAULT_MIGRATION_DIR: Final = f"{os.getcwd()}/avocado_migrations"
+# directory to store migration files if not specified, relative to the working directory when it is used
+DEFAULT_MIGRATION_DIR: Final = "avocado_migrations"
+
+# directory to store the migration manifest cache
+CACHE_DIR: Final = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "pyarango_migrations")
+
+# maximum number of HTTP connections kept open per host
+DEFAULT_POOL_SIZE: Final = 10
+
+# seconds a multi-tenant batch may run before a "stuck" warning is logged
+STUCK_BATCH_WARNING_SECONDS: Final = 60
+
+
+class Defaults(NamedTuple):
+    host: str
+    collection: str
+    user: str
+    password: str
+    script_directory: str
+    batch_size: int
+    workers: int
 
-TIMESTAMP_FORMAT: Final = "%Y-%m-%dT%H:%M:%S.%fZ"
 
-Defaults = namedtuple(
-    "Defaults",
-    [
-        "host",
-        "collection",
-        "user",
-        "password",
-        "script_directory",
-    ],
-)
 DEFAULTS = Defaults(
     host="http://localhost:8529",
     collection=MIGRATION_COLLECTION,
     user="root",
     password="",
     script_directory=DEFAULT_MIGRATION_DIR,
+    batch_size=50,
+    workers=8,
 )
@@ -1,23 +1,81 @@
-__all__ = ("create_migration_script", "run_migrations", "Database", "InvalidMigrationError", "Migration")
+__all__ = (
+    "compile_migration_scripts",
+    "create_migration_script",
+    "run_migrations",
+    "run_multi_tenant_migrations",
+    "Database",
+    "InvalidMigrationError",
+    "Migration",
+)
+import base64
+import compileall
+import hashlib
 import json
 import logging
 import os
 import re
-from collections import deque
+import threading
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from functools import cache
+from heapq import heapify, heappop, heappush
+from operator import attrgetter
 from types import ModuleType
-from typing import Iterator
+from typing import Callable, Iterable, Iterator, Sequence
 
 import arango.exceptions
 from arango import ArangoClient, database
+from arango.http import DefaultHTTPClient
 
-from pyarango_migrations.constants import DEFAULTS, MIGRATION_TEMPLATE_PATH
-from pyarango_migrations.utils import generate_timestamp, has_method, import_module
+from pyarango_migrations.constants import (
+    CACHE_DIR,
+    DEFAULT_POOL_SIZE,
+    DEFAULTS,
+    MIGRATION_TEMPLATE_PATH,
+    STUCK_BATCH_WARNING_SECONDS,
+)
+from pyarango_migrations.utils import chunked, generate_timestamp, import_module, read_json, read_module_constant
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# migration script filename. e.g. 0001_initial.py
+_MIGRATION_FILE_RE = re.compile(r"^\d{4}_\w+\.py$")
+_MODULE_NAME_RE = re.compile(r"[^\w]+")
+# any path whose filename is not a migration script, used to exclude files from compileall
+_NOT_MIGRATION_PATH_RE = re.compile(r"(?:^|[\\/])(?!\d{4}_\w+\.py$)[^\\/]+$")
+
+
+def _is_migration_key(key: str) -> bool:
+    """
+    Check whether a string is a migration key, a 4-digit number. e.g. 0001
+
+    :param key: String to check.
+    :return: True if the string is a migration key.
+    """
+    # isascii excludes non-ASCII digits that isdigit accepts
+    return len(key) == 4 and key.isascii() and key.isdigit()
+
+
+def _is_migration_filename(name: str) -> bool:
+    """
+    Check whether a filename is a migration script filename. e.g. 0001_initial.py
+
+    :param name: Filename to check.
+    :return: True if the filename is a migration script filename.
+    """
+    # cheap checks first so most unrelated files never reach the regex
+    return (
+        len(name) > 8
+        and name[4] == "_"
+        and name.endswith(".py")
+        and name[:4].isdigit()
+        and bool(_MIGRATION_FILE_RE.match(name))
+    )
+
 
 def _get_migration_filenames_in_path(directory: str) -> Iterator[str]:
     """
@@ -29,13 +87,33 @@ def _get_migration_filenames_in_path(directory: str) -> Iterator[str]:
     :param directory: Path to directory containing migration scripts.
     :return: Sorted list of filenames in the directory.
     """
-    if not os.path.isdir(directory):
+    try:
+        entries = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
         raise NotADirectoryError(f"Directory not found: {directory}")
 
-    regex = re.compile(r"^\d{4}_\w+\.py$")
+    with entries:
+        filenames = [entry.name for entry in entries if _is_migration_filename(entry.name) and entry.is_file()]
 
-    for file in filter(regex.match, sorted(os.listdir(directory))):
-        yield file
+    # only the migration scripts are sorted, not the whole directory listing
+    yield from sorted(filenames)
+
+
+def _scan_migration_max(directory: str) -> int:
+    """
+    Get the highest migration key in a directory with a single pass over its entries, without sorting them.
+
+    :param directory: Path to directory containing migration scripts.
+    :return: Highest migration key, or 0 if the directory contains no migration scripts.
+    """
+    latest = 0
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if _is_migration_filename(entry.name) and entry.is_file():
+                latest = max(latest, int(entry.name[:4]))
+
+    return latest
 
 
 def _get_next_migration_filename_prefix(directory: str) -> str:
@@ -45,11 +123,18 @@ def _get_next_migration_filename_prefix(directory: str) -> str:
     :param directory: Path to directory containing migration scripts.
     :return: Zero-padded string representing the next migration script filename prefix.
     """
-    try:
-        prefix = str(int(deque(_get_migration_filenames_in_path(directory), maxlen=1)[0].split("_")[0]) + 1)
-    except IndexError:
-        prefix = "1"
-    return prefix.zfill(4)
+    return f"{_scan_migration_max(directory) + 1:04d}"
+
+
+@cache
+def _get_migration_template() -> str:
+    """
+    Read the migration script template. The template never changes at runtime, so it is only read once.
+
+    :return: Migration script template.
+    """
+    with open(MIGRATION_TEMPLATE_PATH, "r") as f:
+        return f.read()
 
 
 def create_migration_script(name: str, directory: str = DEFAULTS.script_directory) -> None:
@@ -69,8 +154,7 @@ def create_migration_script(name: str, directory: str = DEFAULTS.script_director
     # create migration script
     filename = f"{_get_next_migration_filename_prefix(directory)}_{name}.py"
 
-    with open(os.path.join(MIGRATION_TEMPLATE_PATH), "r") as f:
-        template = f.read().format_map({"date": datetime.now().strftime("%Y-%m-%d"), "filename": filename})
+    template = _get_migration_template().format_map({"date": datetime.now().strftime("%Y-%m-%d"), "filename": filename})
 
     with open(os.path.join(directory, filename), "w") as f:
         f.write(template)
@@ -91,29 +175,79 @@ class Migration:
     The Migration class represents a migration script that enables database upgrades and downgrades.
     """
 
+    # migrations are kept in memory for every script in the directory, slots keep the unloaded ones small
+    __slots__ = ("filepath", "module", "key", "key_int", "_depends_on", "_upgrade", "_downgrade")
+
+    _lock = threading.Lock()
+
     def __init__(self, filepath: str) -> None:
         """
-        Initialize a migration object.
+        Initialize a migration object. The migration script is not imported until it is run.
 
         :param filepath: Path to migration script.
         """
-        location, filename = os.path.split(filepath)
-
-        # load the migration module and validate it has the required methods
-        module_name = re.sub(r"[^\w]+", "_", os.path.splitext(filename)[0]).lower()
-        self.module = import_module(module_name, os.path.join(location, filename))
-        self.validate_import(self.module)
+        self.filepath = filepath
+        self.module: ModuleType | None = None
+        self._depends_on: tuple[str, ...] | None = None
 
         # save reference to filename prefix (e.g. 0001) as the migration key
-        self.key = filename.split("_")[0]
+        self.key = os.path.basename(filepath).split("_")[0]
+        self.key_int = int(self.key)
+
+    @property
+    def depends_on(self) -> tuple[str, ...]:
+        """
+        Keys of the migrations this migration explicitly depends on, read from the module-level `dependsOn` list of the
+        migration script without importing it.
+        """
+        if self._depends_on is not None:
+            return self._depends_on
+
+        try:
+            depends_on = read_module_constant(self.filepath, "dependsOn") or ()
+        except SyntaxError as e:
+            raise InvalidMigrationError(f"Invalid migration script {self.filepath}. {e}") from e
+        except ValueError:
+            raise InvalidMigrationError(f"Invalid migration script {self.filepath}. dependsOn must be a literal list.")
+
+        if not isinstance(depends_on, (list, tuple)) or not all(isinstance(key, str) for key in depends_on):
+            raise InvalidMigrationError(f"Invalid migration script {self.filepath}. dependsOn must be a list of keys.")
+
+        self._depends_on = tuple(depends_on)
+        return self._depends_on
+
+    @depends_on.setter
+    def depends_on(self, value: tuple[str, ...]) -> None:
+        self._depends_on = value
+
+    def _load(self) -> None:
+        """
+        Import the migration module and validate it has the required methods. The module is only imported once.
+        """
+        if self.module is not None:
+            return
+
+        with self._lock:
+            if self.module is not None:
+                return
+
+            # load the migration module and validate it has the required methods
+            module_name = _MODULE_NAME_RE.sub("_", os.path.splitext(os.path.basename(self.filepath))[0]).lower()
+            module = import_module(module_name, self.filepath)
+            self._upgrade, self._downgrade = self.validate_import(module)
+            self.module = module
 
     @staticmethod
-    def validate_import(module: ModuleType) -> None:
+    def validate_import(module: ModuleType) -> tuple[Callable, Callable]:
         """
         Validate the imported migration module has the required methods.
+
+        :return: Tuple containing the upgrade and downgrade functions.
         """
-        if missing := [method for method in ("upgrade", "downgrade") if not has_method(module, method)]:
+        methods = {method: getattr(module, method, None) for method in ("upgrade", "downgrade")}
+        if missing := [method for method, func in methods.items() if not callable(func)]:
             raise InvalidMigrationError(f"Invalid migration script. Missing methods: {missing}")
+        return methods["upgrade"], methods["downgrade"]
 
     def upgrade(self, db: database.Database) -> None:
         """
@@ -121,7 +255,8 @@ class Migration:
 
         :param db: Database object.
         """
-        self.module.upgrade(db)
+        self._load()
+        self._upgrade(db)
 
     def downgrade(self, db: database.Database) -> None:
         """
@@ -129,10 +264,25 @@ class Migration:
 
         :param db: Database object.
         """
-        self.module.downgrade(db)
+        self._load()
+        self._downgrade(db)
 
     def __repr__(self):
-        return f"<Migration: {self.module.__name__}>"
+        return f"<Migration: {os.path.basename(self.filepath)}>"
+
+
+@cache
+def _get_client(host: str, pool_size: int = DEFAULT_POOL_SIZE) -> ArangoClient:
+    """
+    Get the ArangoClient for a host. The client is shared so every database on the host reuses the same HTTP
+    connection pool.
+
+    :param host: ArangoDB host address.
+    :param pool_size: Maximum number of connections kept open to the host, should be at least the number of threads
+        using the client.
+    :return: ArangoClient instance.
+    """
+    return ArangoClient(hosts=host, http_client=DefaultHTTPClient(request_timeout=900, pool_maxsize=pool_size))
 
 
 class Database:
@@ -140,7 +290,16 @@ class Database:
     The Database object establishes a connection to an Arango database and is utilized for running migrations.
     """
 
-    def __init__(self, host: str, dbname: str, username: str, password: str, collection_name: str = DEFAULTS.collection):
+    def __init__(
+        self,
+        host: str,
+        dbname: str,
+        username: str,
+        password: str,
+        collection_name: str = DEFAULTS.collection,
+        client: ArangoClient | None = None,
+        history_cache: bool = False,
+    ):
         """
         Initialize a database object.
 
@@ -149,16 +308,18 @@ class Database:
         :param username: ArangoDB username.
         :param password: ArangoDB password.
         :param collection_name: Name of collection to store migration history.
+        :param client: Optional ArangoClient to connect with, defaults to the client shared by all databases on the host.
+        :param history_cache: Cache the applied migrations locally between runs. The cache is trusted as long as the
+            history collection has the same number of documents, so the collection must only be changed by this tool.
         """
-        # check if host, dbname, username, and password are valid strings
-        if not all(isinstance(arg, str) and arg.strip() for arg in (host, dbname, username, password)):
+        # type checks are skipped when running with python -O, the CLI already passes strings
+        if __debug__ and not all(isinstance(arg, str) for arg in (host, dbname, username, password, collection_name)):
             raise ValueError("All arguments must be non-empty strings")
 
-        # check if collection_name is a valid string
-        if not isinstance(collection_name, str) or not collection_name.strip():
-            raise ValueError("Collection name must be a non-empty string")
+        if not (host and dbname and username and password and collection_name):
+            raise ValueError("All arguments must be non-empty strings")
 
-        client = ArangoClient(hosts=host, request_timeout=900)
+        client = client or _get_client(host)
 
         # save reference to database connection
         self.conn = client.db(dbname, username=username, password=password)
@@ -171,84 +332,379 @@ class Database:
         )
         self.collection_name = collection_name
 
-    def __migrate_up(self, migrations: list[Migration]) -> None:
+        # keys of applied migrations, loaded when first needed and kept in sync as migrations are applied or rolled back
+        self._applied: set[str] | None = None
+        self._history_cache_path = _get_history_cache_path(host, dbname, collection_name) if history_cache else None
+
+    def _load_applied(self) -> set[str]:
+        """
+        Load the keys of all applied migrations from the history collection, or from the local history cache if it is
+        enabled and the history collection still has the same number of documents. The keys are only loaded once.
+
+        :return: Set of applied migration keys.
+        """
+        if self._applied is not None:
+            return self._applied
+
+        if self._history_cache_path and (cached := _read_cache_file(self._history_cache_path)):
+            try:
+                if cached["count"] == self.history.count():
+                    self._applied = _decode_keys(cached["bits"])
+                    return self._applied
+            except (KeyError, TypeError, ValueError):
+                pass
+
+        cursor = self.conn.aql.execute(
+            "FOR m IN @@collection RETURN m._key",
+            bind_vars={"@collection": self.collection_name},
+            batch_size=10000,
+            ttl=60,
+            stream=True,
+        )
+        try:
+            self._applied = set(cursor)
+        finally:
+            # the server frees exhausted cursors, free an unfinished one right away instead of waiting for its ttl
+            if cursor.has_more():
+                cursor.close(ignore_missing=True)
+
+        self._save_history_cache()
+        return self._applied
+
+    def _save_history_cache(self) -> None:
+        """
+        Save the applied migration keys to the local history cache, if it is enabled.
+        """
+        if not self._history_cache_path or self._applied is None:
+            return
+        # keys that are not 4-digit numbers cannot be stored in the bit vector
+        if all(_is_migration_key(key) for key in self._applied):
+            _write_cache_file(self._history_cache_path, {"count": len(self._applied), "bits": _encode_keys(self._applied)})
+
+    def __record_applied(self, key: str) -> None:
+        """
+        Write the history record of an applied migration. Fails if the migration was already recorded, for example by
+        another run migrating the same database at the same time.
+
+        :param key: Key of the applied migration.
+        """
+        self.history.insert({"_key": key, "ts": generate_timestamp()})
+        self._load_applied().add(key)
+        self._save_history_cache()
+
+    def __record_rolled_back(self, key: str) -> None:
+        """
+        Remove the history record of a rolled back migration.
+
+        :param key: Key of the rolled back migration.
+        """
+        # the history cache must be kept in sync, so load the applied keys if they are cached. They are loaded before
+        # the delete, while the cached count still matches the history collection.
+        applied = self._load_applied() if self._applied is not None or self._history_cache_path else None
+        self.history.delete(key)
+        if applied is not None:
+            applied.discard(key)
+        self._save_history_cache()
+
+    def __migrate_up(self, migrations: Iterable[Migration]) -> None:
         logger.info("db.upgrade: running upgrade migrations")
 
-        applied_migrations = {entity["_key"] for entity in self.history.all()}
+        applied = self._load_applied()
 
         for m in migrations:
-            if m.key in applied_migrations:
+            if m.key in applied:
                 logger.info(f"db.upgrade: migration {m.key} has already been applied, skipping.")
                 continue
             logger.info(f"db.upgrade: running migration {m.key}")
             m.upgrade(self.conn)
-            self.history.insert({"_key": m.key, "ts": generate_timestamp()})
+            # record each migration as soon as it completes, so an interrupted run never applies it twice
+            self.__record_applied(m.key)
 
         logger.info("db.upgrade: complete")
 
-    def __migrate_down(self, migrations: list[Migration]) -> None:
+    def __migrate_down(self, migrations: Iterable[Migration]) -> None:
         logger.info("db.upgrade: running downgrade migrations")
 
         for m in migrations:
             logger.info(f"db.downgrade: running migration {m.key}")
             m.downgrade(self.conn)
-            self.history.delete(m.key)
+            self.__record_rolled_back(m.key)
 
         logger.info("db.downgrade: complete")
 
-    def migrate(self, migrations: list[Migration], target: str | None) -> None:
-        if not isinstance(migrations, list):
-            raise ValueError("Invalid migration list. Must be a list of Migration objects.")
+    def head_key(self) -> str:
+        """
+        Get the key of the latest migration applied to the database.
+
+        :return: Latest migration key, or 0000 if no migrations have been applied.
+        """
+        if self._applied is not None:
+            return max(self._applied, default="0000")
+
+        # the primary index is sorted by _key, so this only reads a single key. The query always returns one value
+        # and its result is served from the query results cache until the history collection changes.
+        # not streamed, since streaming queries cannot use the query results cache. The single result is returned
+        # with the response, so no server-side cursor is left open.
+        latest = self.conn.aql.execute(
+            "RETURN FIRST(FOR m IN @@collection SORT m._key DESC LIMIT 1 RETURN m._key)",
+            bind_vars={"@collection": self.collection_name},
+            cache=True,
+        ).next()
+
+        # if no migrations have been applied, set latest to 0000
+        return latest or "0000"
+
+    def migrate(self, migrations: Sequence[Migration], target: str | None) -> bool:
+        """
+        Upgrade or downgrade the database to the target migration.
+
+        :param migrations: Migrations sorted by key.
+        :param target: Target migration key, defaults to the last migration.
+        :return: False if the database was already at the target migration and nothing was run.
+        """
+        if not isinstance(migrations, (list, tuple)):
+            raise ValueError("Invalid migration list. Must be a list or tuple of Migration objects.")
         if not migrations:
             logger.warning("db.migrate: no migrations to run")
-            return
+            return False
 
         logger.info(f"db.migrate: starting {self.conn.name}")
 
         target = target or migrations[-1].key
-
-        try:
-            # get the latest migration key from the history collection
-            latest = self.conn.aql.execute(
-                "FOR m IN @@collection SORT m._key DESC LIMIT 1 RETURN m", bind_vars={"@collection": self.collection_name}
-            ).next()["_key"]
-        except StopIteration:
-            # if no migrations have been applied, set latest to 0000
-            latest = "0000"
+        latest = self.head_key()
 
         if target == latest:
             logger.info(f"db.migrate: target migration {target} is the latest migration, skipping {self.conn.name}")
-            return
+            return False
 
-        is_target_less_than_latest = target < latest
+        # migrations are sorted by key, so the ones between the latest and target form a contiguous slice
+        lower, upper = sorted((int(latest), int(target)))
+        key = attrgetter("key_int")
+        lo = bisect_right(migrations, lower, key=key)
+        hi = bisect_right(migrations, upper, key=key)
+        window = migrations[lo:hi]
 
-        # filter migrations to only those between the latest and target
-        migrations = sorted(
-            [m for m in migrations if (latest < m.key <= target) or (target < m.key <= latest)],
-            key=lambda m: m.key,
-            reverse=is_target_less_than_latest,
-        )
-
-        if is_target_less_than_latest:
-            self.__migrate_down(migrations)
+        if target < latest:
+            self.__migrate_down(reversed(window))
         else:
-            self.__migrate_up(migrations)
+            self.__migrate_up(window)
 
         logger.info(f"db.migrate: complete {self.conn.name}")
+        return True
 
     def __repr__(self):
         return f"<Database: {self.conn.name}>"
 
 
-@cache
-def _load_migrations_from_dir(path: str) -> list[Migration]:
+def _sort_migrations(migrations: list[Migration]) -> tuple[Migration, ...]:
     """
-    Load migrations from a directory.
+    Sort migrations topologically so every migration runs after its dependencies, using Kahn's algorithm. Each
+    migration implicitly depends on the migration before it and may declare additional dependencies in `dependsOn`.
+    When several migrations are ready the one with the lowest key runs first.
+
+    :param migrations: List of migrations sorted by key.
+    :return: Tuple of migrations in dependency order.
+    """
+    # without explicit dependencies the implicit ones already match the key order
+    if not any(m.depends_on for m in migrations):
+        return tuple(migrations)
+
+    by_key = {m.key: m for m in migrations}
+    dependencies = {m.key: set(m.depends_on) for m in migrations}
+
+    for previous, current in zip(migrations, migrations[1:]):
+        dependencies[current.key].add(previous.key)
+
+    dependents = defaultdict(list)
+    for key, keys in dependencies.items():
+        if unknown := keys - by_key.keys():
+            raise InvalidMigrationError(f"Migration {key} depends on unknown migrations: {sorted(unknown)}")
+        for dependency in keys:
+            dependents[dependency].append(key)
+
+    remaining = {key: len(keys) for key, keys in dependencies.items()}
+    ready = [key for key, count in remaining.items() if not count]
+    heapify(ready)
+
+    ordered = []
+    while ready:
+        key = heappop(ready)
+        ordered.append(by_key[key])
+        for dependent in dependents[key]:
+            remaining[dependent] -= 1
+            if not remaining[dependent]:
+                heappush(ready, dependent)
+
+    if len(ordered) != len(migrations):
+        raise InvalidMigrationError(f"Circular migration dependencies: {sorted(k for k, n in remaining.items() if n)}")
+
+    return tuple(ordered)
+
+
+# loaded migrations by directory path, along with the directory modification time they were loaded at
+_migrations_cache: dict[str, tuple[int, tuple[Migration, ...]]] = {}
+
+
+def _load_migrations_from_dir(path: str) -> tuple[Migration, ...]:
+    """
+    Load migrations from a directory. Results are cached until the directory is modified, and returned as a tuple so
+    they can be shared between threads.
+
+    :param path: Path to directory containing migration scripts.
+    :return: Tuple of migrations.
+    """
+    # relative paths (like the default script directory) are cached by their absolute path
+    path = os.path.abspath(path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        raise NotADirectoryError(f"Directory not found: {path}")
+
+    if (cached := _migrations_cache.get(path)) is not None and cached[0] == mtime:
+        return cached[1]
+
+    migrations = _load_migrations(path)
+    _migrations_cache[path] = (mtime, migrations)
+    return migrations
+
+
+def compile_migration_scripts(directory: str) -> bool:
+    """
+    Compile the migration scripts in a directory to bytecode in parallel, so importing them later reads the cached
+    bytecode from __pycache__ instead of compiling each script while holding the import lock.
+
+    :param directory: Path to directory containing migration scripts.
+    :return: True if every script compiled successfully.
+    """
+    return bool(compileall.compile_dir(directory, maxlevels=0, rx=_NOT_MIGRATION_PATH_RE, quiet=1, workers=0))
+
+
+def _get_manifest_path(path: str) -> str:
+    """
+    Get the path of the manifest cache for a migration directory. There is a single manifest per directory, which is
+    overwritten whenever the migration scripts change.
+
+    :param path: Path to directory containing migration scripts.
+    :return: Path to the manifest file.
+    """
+    digest = hashlib.sha1(os.path.realpath(path).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, "manifests", f"{digest}.json")
+
+
+def _get_manifest_hash(path: str, filenames: list[str]) -> str:
+    """
+    Hash the name and modification time of every migration script in a directory, so any change to the scripts
+    invalidates the manifest.
+
+    :param path: Path to directory containing migration scripts.
+    :param filenames: Sorted migration script filenames in the directory.
+    :return: Hex digest.
+    """
+    digest = hashlib.sha1()
+    for filename in filenames:
+        digest.update(f"{filename}:{os.stat(os.path.join(path, filename)).st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+def _read_cache_file(path: str) -> dict | None:
+    """
+    Read a JSON cache file.
+
+    :param path: Path to the cache file.
+    :return: Cache contents, or None if there is no usable cache file.
+    """
+    try:
+        return read_json(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_file(path: str, content: dict) -> None:
+    """
+    Write a JSON cache file. Failures are logged and ignored since the file is only a cache.
+
+    :param path: Path to the cache file.
+    :param content: Cache contents.
+    """
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to a temporary file first so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(content, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Unable to write cache file {path}: {e}")
+
+
+def _get_history_cache_path(host: str, dbname: str, collection_name: str) -> str:
+    """
+    Get the path of the applied migrations cache for a migration history collection.
+
+    :param host: ArangoDB host address.
+    :param dbname: ArangoDB database name.
+    :param collection_name: Name of collection to store migration history.
+    :return: Path to the cache file.
+    """
+    digest = hashlib.sha1(f"{host}\0{dbname}\0{collection_name}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, "history", f"{digest}.json")
+
+
+def _encode_keys(keys: set[str]) -> str:
+    """
+    Encode 4-digit migration keys as a base64 bit vector, one bit per possible key.
+
+    :param keys: Migration keys.
+    :return: Base64 encoded bit vector.
+    """
+    bits = bytearray(10000 // 8)
+    for key in map(int, keys):
+        bits[key >> 3] |= 1 << (key & 7)
+    return base64.b64encode(bits).decode()
+
+
+def _decode_keys(encoded: str) -> set[str]:
+    """
+    Decode a base64 bit vector created by `_encode_keys`.
+
+    :param encoded: Base64 encoded bit vector.
+    :return: Migration keys.
+    """
+    bits = base64.b64decode(encoded, validate=True)
+    return {f"{key:04d}" for key in range(len(bits) * 8) if bits[key >> 3] >> (key & 7) & 1}
+
+
+def _load_migrations(path: str) -> tuple[Migration, ...]:
+    """
+    Load migrations from a directory and sort them in dependency order.
 
     :param path: Path to directory containing migration scripts.
-    :return: List of migrations.
+    :return: Tuple of migrations.
     """
-    return [Migration(os.path.join(path, filename)) for filename in _get_migration_filenames_in_path(path)]
+    filenames = list(_get_migration_filenames_in_path(path))
+    migrations = [Migration(os.path.join(path, filename)) for filename in filenames]
+
+    # Database.migrate relies on the migrations being sorted by key without duplicates
+    for previous, current in zip(migrations, migrations[1:]):
+        if previous.key_int >= current.key_int:
+            raise InvalidMigrationError(f"Duplicate migration key: {current.key}")
+
+    # reuse the dependencies parsed by a previous run if none of the scripts changed
+    manifest_path = _get_manifest_path(path)
+    manifest_hash = _get_manifest_hash(path, filenames)
+
+    manifest = _read_cache_file(manifest_path)
+    if manifest is not None and manifest.get("hash") == manifest_hash:
+        for m in migrations:
+            m.depends_on = tuple(manifest["dependsOn"][os.path.basename(m.filepath)])
+        return _sort_migrations(migrations)
+
+    migrations = _sort_migrations(migrations)
+    _write_cache_file(
+        manifest_path,
+        {"hash": manifest_hash, "dependsOn": {os.path.basename(m.filepath): list(m.depends_on) for m in migrations}},
+    )
+    return migrations
 
 
 @cache
@@ -260,13 +716,22 @@ def _read_credentials_from_file(path: str) -> tuple[str, str]:
     :return: Tuple containing database username and password.
     """
     try:
-        with open(path, "r") as f:
-            creds = json.load(f)
-            return creds["username"], creds["password"]
+        creds = read_json(path)
+        return creds["username"], creds["password"]
     except KeyError as e:
         raise Exception(f"Invalid credentials file: {path}. Missing key: {e}")
 
 
+def _validate_target(target: str | None) -> None:
+    """
+    Validate a target migration number.
+
+    :param target: Target migration number in the format of a 4-digit number. e.g. 0001
+    """
+    if target and not _is_migration_key(target):
+        raise ValueError("Invalid target migration. Must be a 4-digit number. e.g. 0001")
+
+
 def run_migrations(
     dbname: str,
     host: str = DEFAULTS.host,
@@ -276,6 +741,7 @@ def run_migrations(
     target: str | None = None,
     credentials_file: str = None,
     collection: str = DEFAULTS.collection,
+    cache_history: bool = False,
 ) -> None:
     """
     Run database migrations for single-tenant database.
@@ -296,12 +762,12 @@ def run_migrations(
     :param target: Target migration number in the format of a 4-digit number. e.g. 0001
     :param credentials_file: Optional path to JSON file containing database credentials to override username/password.
     :param collection: Name of collection to store migration history.
+    :param cache_history: Cache the applied migrations locally between runs.
     :return: None
     """
     if not dbname:
         raise ValueError("Database name is required.")
-    if target and not re.match(r"^\d{4}$", target):
-        raise ValueError("Invalid target migration. Must be a 4-digit number. e.g. 0001")
+    _validate_target(target)
     try:
         # attempt to load migration scripts from the specified directory
         migrations = _load_migrations_from_dir(script_directory)
@@ -314,7 +780,7 @@ def run_migrations(
             username, password = _read_credentials_from_file(credentials_file)
 
         # attempt to establish a connection to the database.
-        db = Database(host, dbname, username, password, collection_name=collection)
+        db = Database(host, dbname, username, password, collection_name=collection, history_cache=cache_history)
 
         # run database migrations
         db.migrate(migrations, target)
@@ -323,3 +789,136 @@ def run_migrations(
         raise
     except Exception:
         logger.exception(f"db.migrate: failed to run migrations for {dbname} database.")
+
+
+def _run_for_tenant(
+    client: ArangoClient,
+    dbname: str,
+    migrations: Sequence[Migration],
+    target: str | None,
+    host: str,
+    username: str,
+    password: str,
+    collection: str,
+    cache_history: bool,
+) -> bool:
+    """
+    Migrate a single tenant database using migrations that were already loaded. Unlike `run_migrations`, errors are
+    raised so they can be collected per tenant.
+
+    :return: False if the tenant was already at the target migration.
+    """
+    db = Database(host, dbname, username, password, collection, client=client, history_cache=cache_history)
+    return db.migrate(migrations, target)
+
+
+def run_multi_tenant_migrations(
+    dbnames: Iterable[str],
+    host: str = DEFAULTS.host,
+    username: str = DEFAULTS.user,
+    password: str = DEFAULTS.password,
+    script_directory: str = DEFAULTS.script_directory,
+    target: str | None = None,
+    credentials_file: str = None,
+    collection: str = DEFAULTS.collection,
+    cache_history: bool = False,
+    batch_size: int = DEFAULTS.batch_size,
+    workers: int = DEFAULTS.workers,
+    precompile: bool = True,
+) -> dict[str, BaseException]:
+    """
+    Run database migrations for multiple tenant databases on the same host. Tenants are migrated concurrently in
+    batches, and each batch must finish before the next one starts.
+
+    Invalid arguments and credentials, a missing script directory and, when precompiling, scripts that do not compile
+    are raised before any tenant is migrated. Scripts are only imported when they are first run, so other errors in a
+    script, like a missing downgrade function, fail each tenant that reaches it after the migrations before it have run.
+    Errors while migrating a tenant are logged and returned, so the remaining tenants are still migrated.
+
+    :param dbnames: ArangoDB database names of the tenants.
+    :param host: ArangoDB host address.
+    :param username: ArangoDB username.
+    :param password: ArangoDB password.
+    :param script_directory: Path to directory containing migration scripts.
+    :param target: Target migration number in the format of a 4-digit number. e.g. 0001
+    :param credentials_file: Optional path to JSON file containing database credentials to override username/password.
+    :param collection: Name of collection to store migration history.
+    :param cache_history: Cache the applied migrations locally between runs.
+    :param batch_size: Number of tenants migrated per batch.
+    :param workers: Number of tenants migrated concurrently.
+    :param precompile: Compile the migration scripts to bytecode before running migrations.
+    :return: Errors by database name for the tenants that failed.
+    """
+    _validate_target(target)
+
+    # compile the scripts in parallel up front instead of serially while importing them. A script that does not
+    # compile would fail in every tenant after the migrations before it have run, so stop before any tenant is touched.
+    if precompile and not compile_migration_scripts(script_directory):
+        raise InvalidMigrationError(f"Unable to compile migration scripts in {script_directory}")
+
+    # read the credentials once instead of once per tenant
+    if credentials_file:
+        username, password = _read_credentials_from_file(credentials_file)
+
+    # check the connection arguments once, instead of failing every tenant with the same error
+    if not (host and username and password and collection):
+        raise ValueError("Host, username, password and collection must be non-empty strings")
+
+    # tenants sharing a database only need to be migrated once
+    seen: set[str] = set()
+    unique_dbnames = []
+    for dbname in dbnames:
+        if dbname in seen:
+            logger.info(f"multi-tenant: skipping duplicate database {dbname}")
+            continue
+        seen.add(dbname)
+        unique_dbnames.append(dbname)
+
+    # load the migration list once so every worker shares the cached list
+    migrations = _load_migrations_from_dir(script_directory)
+
+    if not migrations:
+        raise Exception(f"No migrations found in {script_directory}")
+
+    failures: dict[str, BaseException] = {}
+    # tenants already at the target migration, which Database.migrate skips after reading their latest migration
+    at_target = 0
+
+    # all tenants share one client with a connection pool large enough for every worker
+    client = _get_client(host, pool_size=max(workers, DEFAULT_POOL_SIZE))
+    tenant_args = (target, host, username, password, collection, cache_history)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for number, batch in enumerate(chunked(unique_dbnames, batch_size), start=1):
+            logger.info(f"multi-tenant: starting batch {number} ({len(batch)} tenants)")
+            started = time.monotonic()
+
+            timer = threading.Timer(
+                STUCK_BATCH_WARNING_SECONDS,
+                logger.warning,
+                args=(f"multi-tenant: batch {number} has been running for over {STUCK_BATCH_WARNING_SECONDS}s",),
+            )
+            timer.start()
+            try:
+                futures = {
+                    executor.submit(_run_for_tenant, client, dbname, migrations, *tenant_args): dbname for dbname in batch
+                }
+                wait(futures)
+            finally:
+                timer.cancel()
+
+            for future, dbname in futures.items():
+                if error := future.exception():
+                    logger.error(f"multi-tenant: failed to migrate {dbname}", exc_info=error)
+                    failures[dbname] = error
+                elif not future.result():
+                    at_target += 1
+
+            logger.info(f"multi-tenant: finished batch {number} in {time.monotonic() - started:.2f}s")
+
+    logger.info(f"multi-tenant: {at_target} of {len(unique_dbnames)} tenants were already at the target migration")
+
+    if failures:
+        logger.error(f"multi-tenant: {len(failures)} tenants failed: {', '.join(failures)}")
+
+    return failures
@@ -1,31 +1,98 @@
-import importlib.util
-from datetime import datetime
-from types import ModuleType
+import ast
+import os
+from datetime import datetime, timezone
+from importlib.machinery import SourceFileLoader
+from itertools import islice
+from pathlib import Path
+from types import CodeType, ModuleType
+from typing import Any, Iterable, Iterator, TypeVar
 
-from pyarango_migrations.constants import TIMESTAMP_FORMAT
+try:
+    # orjson is an optional dependency, its decode errors subclass json.JSONDecodeError
+    import orjson as json
+except ImportError:
+    import json
+
+T = TypeVar("T")
+
+# compiled migration code by file location, keyed on the source mtime so edited files are recompiled
+_CODE_CACHE: dict[str, tuple[int, CodeType]] = {}
 
 
 def import_module(module_name: str, location: str) -> ModuleType:
     """
     Import module from a file location.
-    https://docs.python.org/3.11/library/importlib.html#importing-a-source-file-directly
+
+    The module is executed into a fresh namespace without registering it in sys.modules. Its code object is cached
+    for the lifetime of the process, so each migration file is read and compiled at most once per modification.
     """
-    module_spec = importlib.util.spec_from_file_location(module_name, location)
-    loader = importlib.util.LazyLoader(module_spec.loader)
-    module_spec.loader = loader
-    module = importlib.util.module_from_spec(module_spec)
-    loader.exec_module(module)
+    mtime_ns = os.stat(location).st_mtime_ns
+    cached = _CODE_CACHE.get(location)
+    if cached is not None and cached[0] == mtime_ns:
+        code = cached[1]
+    else:
+        # the source loader reads and writes __pycache__, so a precompiled directory skips compilation entirely
+        code = SourceFileLoader(module_name, location).get_code(module_name)
+        _CODE_CACHE[location] = (mtime_ns, code)
+
+    module = ModuleType(module_name)
+    module.__file__ = location
+    exec(code, module.__dict__)
     return module
 
 
-def has_method(an_object: object, method_name: str) -> bool:
-    return hasattr(an_object, method_name) and callable(getattr(an_object, method_name))
+def read_module_constant(location: str, name: str) -> Any:
+    """
+    Read the literal value assigned to a module-level name from a source file without importing it.
+
+    :param location: Path to the module source file.
+    :param name: Name of the module-level variable.
+    :return: Value of the variable, or None if the module does not assign it.
+    """
+    with open(location, "r") as f:
+        source = f.read()
+
+    # avoid parsing modules that cannot contain the name
+    if name not in source:
+        return None
+
+    for node in ast.parse(source, location).body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == name for t in node.targets):
+            return ast.literal_eval(node.value)
+        if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.target.id == name:
+            return ast.literal_eval(node.value) if node.value else None
+    return None
+
+
+def read_json(path: str) -> Any:
+    """
+    Read and parse a JSON file, using orjson when it is installed.
+
+    :param path: Path to JSON file.
+    :return: Parsed JSON content.
+    """
+    return json.loads(Path(path).read_bytes())
 
 
 def generate_timestamp() -> str:
     """
-    Generate a timestamp string in the format specified in pyarango_migrations/settings.py.
+    Generate a UTC timestamp string with microseconds. e.g. 2024-01-31T12:00:00.000000Z
 
     :return: Timestamp string.
     """
-    return datetime.now().strftime(TIMESTAMP_FORMAT)
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat(timespec="microseconds") + "Z"
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Split an iterable into lists of at most `size` items.
+
+    :param iterable: Items to split.
+    :param size: Maximum number of items per chunk.
+    :return: Iterator of lists.
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be a positive integer")
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk